@@ -17,6 +17,7 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import os
 import sys
 import logging
 import traceback
@@ -76,6 +77,12 @@ class Logger(logging.getLoggerClass()):
 
         return message_head + message_body
 
+    def __set_args(self, message: str, args: tuple) -> str:
+        # Same %-style arguments as the logging module
+        if args:
+            return str(message) % args
+        return str(message)
+
     def __set_level_color(self, level: str, message: str) -> str:
         color_id = self.log_colors[level]
 
@@ -95,7 +102,9 @@ class Logger(logging.getLoggerClass()):
         if fmt:
             formatter = logging.Formatter(fmt)
 
-        self.root.setLevel(logging.DEBUG)
+        # Debug output is opt-in through GRADIA_DEBUG (see README.md), so
+        # debug() calls can return before formatting anything in normal runs.
+        self.root.setLevel(logging.DEBUG if os.environ.get("GRADIA_DEBUG") else logging.INFO)
 
         self.root.handlers = []
 
@@ -104,13 +113,20 @@ class Logger(logging.getLoggerClass()):
         self.root.addHandler(handler)
 
     def debug(self, message: str, *args, **kwargs) -> None:
-        self.root.debug(self.__set_level_color("debug", str(message)))
+        if not self.root.isEnabledFor(logging.DEBUG):
+            return
+        message = self.__set_args(message, args)
+        self.root.debug(self.__set_level_color("debug", message))
 
     def info(self, message: str, *args, **kwargs) -> None:
-        self.root.info(self.__set_level_color("info", str(message)))
+        if not self.root.isEnabledFor(logging.INFO):
+            return
+        message = self.__set_args(message, args)
+        self.root.info(self.__set_level_color("info", message))
 
     def warning(self, message: str, exception: BaseException | None = None,
                     show_exception: bool = False, show_traceback: bool = False, *args, **kwargs) -> None:
+        message = self.__set_args(message, args)
         if show_exception:
             message += self.__set_exception_info(exception)
         if show_traceback:
@@ -122,6 +138,7 @@ class Logger(logging.getLoggerClass()):
 
     def error(self, message: str, exception: BaseException | None = None,
                 show_exception: bool = False, show_traceback: bool = False, *args, **kwargs) -> None:
+        message = self.__set_args(message, args)
         if show_exception:
             message += self.__set_exception_info(exception)
         if show_traceback:
@@ -143,6 +160,7 @@ class Logger(logging.getLoggerClass()):
 
     def critical(self, message: str, exception: BaseException | None = None,
                     show_exception: bool = False, show_traceback: bool = True, *args, **kwargs) -> None:
+        message = self.__set_args(message, args)
         if show_exception:
             message += self.__set_exception_info(exception)
         if show_traceback:
@@ -16,29 +16,23 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 import os
-from gi.repository import Gdk, GLib, GdkPixbuf
+from gi.repository import Gdk, GdkPixbuf
+
+TEMP_IMAGE_FILE_NAME: str = "clipboard_image.png"
 
 def save_texture_to_file(texture, temp_dir: str) -> str:
-    temp_path: str = os.path.join(temp_dir, "clipboard_image.png")
+    temp_path: str = f"{temp_dir}{os.sep}{TEMP_IMAGE_FILE_NAME}"
     texture.save_to_png(temp_path)
     return temp_path
 
-def save_pixbuff_to_path(temp_dir: str, pixbuff: GdkPixbuf.Pixbuf) -> str:
-    TEMP_FILE_NAME: str = "clipboard_temp.png"
-    temp_path: str = os.path.join(temp_dir, TEMP_FILE_NAME)
-    pixbuff.savev(temp_path, "png", [], [])
-    return temp_path
-
-def copy_file_to_clipboard(local_path: str) -> None:
-    with open(local_path, "rb") as f:
-        png_data: bytes = f.read()
-
+def copy_pixbuf_to_clipboard(pixbuff: GdkPixbuf.Pixbuf) -> None:
     display = Gdk.Display.get_default()
     if not display:
         print("Warning: Failed to retrieve `Gdk.Display` object.")
         return
 
-    bytes_data: GLib.Bytes = GLib.Bytes.new(png_data)
+    # GTK only encodes the texture when another application asks for it,
+    # so nothing is written to or read back from disk here.
+    texture: Gdk.Texture = Gdk.Texture.new_for_pixbuf(pixbuff)
     clipboard: Gdk.Clipboard = display.get_clipboard()
-    content_provider: Gdk.ContentProvider = Gdk.ContentProvider.new_for_bytes("image/png", bytes_data)
-    clipboard.set_content(content_provider)
\ No newline at end of file
+    clipboard.set_texture(texture)
\ No newline at end of file
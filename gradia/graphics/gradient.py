@@ -16,8 +16,11 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 import ctypes
+import math
 from ctypes import c_int, c_double, c_uint8, POINTER, CDLL
+from collections import OrderedDict
 from collections.abc import Callable
+from functools import lru_cache
 from typing import Optional
 from PIL import Image
 from gi.repository import Gtk, Gdk, Adw
@@ -26,21 +29,43 @@ from gradia.constants import PREDEFINED_GRADIENTS
 
 HexColor = str
 RGBTuple = tuple[int, int, int]
-CacheKey = tuple[str, str, int, int, int]
+CacheKey = tuple[int, int, int, int, int]
+PixelBuffer = ctypes.Array[c_uint8] | bytes
 GradientPreset = tuple[str, str, int]
 CacheInfo = dict[str, int | list[CacheKey] | bool]
 
 
+@lru_cache(maxsize=128)
+def hex_to_rgb(hex_color: HexColor) -> RGBTuple:
+    hex_color = hex_color.lstrip('#')
+    r, g, b = (int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+    return (r, g, b)
+
+
+def _prewarm_preset_colors() -> None:
+    # Parse the preset colours up front so picking a preset never hits the
+    # hex parser on the render path.
+    for start, end, _angle in PREDEFINED_GRADIENTS:
+        hex_to_rgb(start)
+        hex_to_rgb(end)
+
+
+_prewarm_preset_colors()
+
+
 class GradientBackground:
     _MAX_CACHE_SIZE: int = 100
-    _gradient_cache: dict[CacheKey, Image.Image] = {}
-    _c_lib: Optional[CDLL | bool] = None
+    _gradient_cache: OrderedDict[CacheKey, PixelBuffer] = OrderedDict()
+    _c_lib: Optional[CDLL] = None
+    _c_lib_checked: bool = False
+    _generate_fn: Optional[Callable[..., None]] = None
 
     @classmethod
     def _load_c_lib(cls) -> None:
-        if cls._c_lib :
+        if cls._c_lib_checked:
             return
-        
+        cls._c_lib_checked = True
+
         try:
             from importlib.resources import files
             gradia_path = files('gradia').joinpath('libgradient_gen.so')
@@ -53,14 +78,35 @@ class GradientBackground:
                 c_double
             ]
             cls._c_lib.generate_gradient.restype = None
+            cls._generate_fn = cls._c_lib.generate_gradient
         except Exception as e:
-            cls._c_lib = False
+            cls._c_lib = None
+            cls._generate_fn = None
 
     def __init__(self, start_color: HexColor = "#4A90E2", end_color: HexColor = "#50E3C2", angle: int = 0) -> None:
-        self.start_color: HexColor = start_color
-        self.end_color: HexColor = end_color
+        self.start_color = start_color
+        self.end_color = end_color
         self.angle: int = angle
-        self._load_c_lib()
+
+    # The colours are packed into ints for the cache key when they are
+    # assigned, so lookups in prepare_image() do no parsing.
+    @property
+    def start_color(self) -> HexColor:
+        return self._start_color
+
+    @start_color.setter
+    def start_color(self, value: HexColor) -> None:
+        self._start_color: HexColor = value
+        self._start_key: int = int(value.lstrip('#'), 16)
+
+    @property
+    def end_color(self) -> HexColor:
+        return self._end_color
+
+    @end_color.setter
+    def end_color(self, value: HexColor) -> None:
+        self._end_color: HexColor = value
+        self._end_key: int = int(value.lstrip('#'), 16)
 
     @classmethod
     def fromIndex(cls, index: int) -> 'GradientBackground':
@@ -72,46 +118,70 @@ class GradientBackground:
     def get_name(self) -> str:
         return f"gradient-{self.start_color}-{self.end_color}-{self.angle}"
 
-    def _hex_to_rgb(self, hex_color: HexColor) -> RGBTuple:
-        hex_color = hex_color.lstrip('#')
-        r, g, b = (int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-        return (r, g, b)
-
-    def _generate_gradient_c(self, width: int, height: int) -> Image.Image:
-        if not self._c_lib or self._c_lib is False:
+    def _generate_gradient_c(self, width: int, height: int) -> PixelBuffer:
+        generate_fn = self._generate_fn
+        if generate_fn is None:
             raise RuntimeError("C gradient library not loaded")
 
-        start_rgb = self._hex_to_rgb(self.start_color)
-        end_rgb = self._hex_to_rgb(self.end_color)
-        pixel_count = width * height * 4
-        pixel_buffer = (c_uint8 * pixel_count)()
+        pixel_buffer = (c_uint8 * (width * height * 4))()
 
-        self._c_lib.generate_gradient(
+        # argtypes already converts the angle to a C double
+        generate_fn(
             pixel_buffer, width, height,
-            start_rgb[0], start_rgb[1], start_rgb[2],
-            end_rgb[0], end_rgb[1], end_rgb[2],
-            float(self.angle)
+            *hex_to_rgb(self.start_color),
+            *hex_to_rgb(self.end_color),
+            self.angle
         )
 
-        return Image.frombytes('RGBA', (width, height), bytes(pixel_buffer))
+        return pixel_buffer
+
+    def _generate_gradient_pil(self, width: int, height: int) -> PixelBuffer:
+        # Same projection as the C kernel, done by stretching a 256-step
+        # ramp along the gradient axis and blending the two colours with it.
+        cos_angle = math.cos(math.radians(self.angle))
+        sin_angle = math.sin(math.radians(self.angle))
+
+        corners = (0.0, (width - 1) * cos_angle, (height - 1) * sin_angle,
+                   (width - 1) * cos_angle + (height - 1) * sin_angle)
+        min_coord = min(corners)
+        scale = 255 / ((max(corners) - min_coord) or 1.0)
+
+        # PIL samples at pixel centres, the C kernel at integer coordinates
+        offset = (-0.5 * (cos_angle + sin_angle) - min_coord) * scale + 0.5
+        mask = Image.linear_gradient('L').transform(
+            (width, height), Image.Transform.AFFINE,
+            (0, 0, 128, cos_angle * scale, sin_angle * scale, offset),
+            Image.Resampling.BILINEAR
+        )
 
-    def prepare_image(self, width: int, height: int) -> Image.Image:
-        cache_key: CacheKey = (self.start_color, self.end_color, self.angle, width, height)
+        start = Image.new('RGBA', (width, height), hex_to_rgb(self.start_color) + (255,))
+        end = Image.new('RGBA', (width, height), hex_to_rgb(self.end_color) + (255,))
+        return Image.composite(end, start, mask).tobytes()
 
-        if cache_key in self._gradient_cache:
-            return self._gradient_cache[cache_key].copy()
+    def _generate_pixels(self, width: int, height: int) -> PixelBuffer:
+        self._load_c_lib()
+        if self._generate_fn is not None:
+            return self._generate_gradient_c(width, height)
+        return self._generate_gradient_pil(width, height)
+
+    def prepare_image(self, width: int, height: int) -> Image.Image:
+        cache_key: CacheKey = (self._start_key, self._end_key, self.angle % 360, width, height)
 
-        self._evict_cache_if_needed()
+        pixel_buffer = self._gradient_cache.get(cache_key)
+        if pixel_buffer is None:
+            self._evict_cache_if_needed()
+            pixel_buffer = self._generate_pixels(width, height)
+            self._gradient_cache[cache_key] = pixel_buffer
+        else:
+            self._gradient_cache.move_to_end(cache_key)
 
-        image = self._generate_gradient_c(width, height)
-        self._gradient_cache[cache_key] = image.copy()
-        return image
+        # Every caller gets its own read-only view of the shared buffer;
+        # PIL copies it on the first write, so the cached pixels stay intact.
+        return Image.frombuffer('RGBA', (width, height), pixel_buffer, 'raw', 'RGBA', 0, 1)
 
     def _evict_cache_if_needed(self) -> None:
-        if len(self._gradient_cache) >= self._MAX_CACHE_SIZE:
-            keys_to_remove = list(self._gradient_cache.keys())[:self._MAX_CACHE_SIZE // 2]
-            for key in keys_to_remove:
-                del self._gradient_cache[key]
+        while len(self._gradient_cache) >= self._MAX_CACHE_SIZE:
+            self._gradient_cache.popitem(last=False)
 
     @classmethod
     def clear_cache(cls) -> None:
@@ -123,11 +193,43 @@ class GradientBackground:
             'cache_size': len(cls._gradient_cache),
             'max_cache_size': cls._MAX_CACHE_SIZE,
             'cached_gradients': list(cls._gradient_cache.keys()),
-            'c_lib_loaded': cls._c_lib is not None and cls._c_lib is not False
+            'c_lib_loaded': cls._generate_fn is not None
         }
 
 
 class GradientSelector:
+    _css_installed: bool = False
+
+    @classmethod
+    def _install_preset_css(cls) -> None:
+        if cls._css_installed:
+            return
+
+        css = "".join(
+            f"""
+                button#gradient-preview-{i} {{
+                    background-image: linear-gradient({angle}deg, {start}, {end});
+                    min-width: 60px;
+                    min-height: 40px;
+                    background-size: cover;
+                    border-radius: 10px;
+                    border: 1px solid rgba(0,0,0,0.1);
+                    transition: filter 0.3s ease;
+                }}
+                button#gradient-preview-{i}:hover {{
+                    filter: brightness(1.2);
+                }}
+            """
+            for i, (start, end, angle) in enumerate(PREDEFINED_GRADIENTS)
+        )
+        css_provider = Gtk.CssProvider()
+        css_provider.load_from_string(css)
+        Gtk.StyleContext.add_provider_for_display(
+            Gdk.Display.get_default(),
+            css_provider,
+            Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
+        )
+        cls._css_installed = True
 
     def __init__(
         self, 
@@ -140,6 +242,7 @@ class GradientSelector:
         self.start_color_button: Optional[Gtk.ColorButton] = None
         self.end_color_button: Optional[Gtk.ColorButton] = None
         self.angle_spin_row: Optional[Adw.SpinRow] = None
+        self._install_preset_css()
         self.widget: Adw.PreferencesGroup = self._build()
 
     def _build(self) -> Adw.PreferencesGroup:
@@ -227,15 +330,15 @@ class GradientSelector:
         return f"#{r:02x}{g:02x}{b:02x}"
 
     def _show_popover(self, button: Gtk.Button) -> None:
-        if self.popover :
-            self.popover.popdown()
-            self.popover = None
+        if self.popover is None:
+            self.popover = self._build_popover(button)
+        self.popover.popup()
 
-        self.popover = Gtk.Popover()
-        if self.popover :
-            self.popover.set_parent(button)
-            self.popover.set_autohide(True)
-            self.popover.set_has_arrow(True)
+    def _build_popover(self, button: Gtk.Button) -> Gtk.Popover:
+        popover = Gtk.Popover()
+        popover.set_parent(button)
+        popover.set_autohide(True)
+        popover.set_has_arrow(True)
 
         flowbox = Gtk.FlowBox(
             max_children_per_line=3,
@@ -252,36 +355,12 @@ class GradientSelector:
 
         for i, (start, end, angle) in enumerate(PREDEFINED_GRADIENTS):
             gradient_name = f"gradient-preview-{i}"
-
-            css = f"""
-                button#{gradient_name} {{
-                    background-image: linear-gradient({angle}deg, {start}, {end});
-                    min-width: 60px;
-                    min-height: 40px;
-                    background-size: cover;
-                    border-radius: 10px;
-                    border: 1px solid rgba(0,0,0,0.1);
-                    transition: filter 0.3s ease;
-                }}
-                button#{gradient_name}:hover {{
-                    filter: brightness(1.2);
-                }}
-            """
-            css_provider = Gtk.CssProvider()
-            css_provider.load_from_string(css)
-            Gtk.StyleContext.add_provider_for_display(
-                Gdk.Display.get_default(),
-                css_provider,
-                Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-            )
-
             button_widget = Gtk.Button(name=gradient_name, focusable=False, can_focus=False)
             button_widget.connect("clicked", self._on_gradient_selected, start, end, angle)
             flowbox.append(button_widget)
 
-        if self.popover :
-            self.popover.set_child(flowbox)
-            self.popover.popup()
+        popover.set_child(flowbox)
+        return popover
 
     def _on_gradient_selected(self, button: Gtk.Button, start: HexColor, end: HexColor, angle: int) -> None:
         self.gradient.start_color = start
@@ -299,4 +378,3 @@ class GradientSelector:
 
         if self.popover:
             self.popover.popdown()
-            self.popover = None
@@ -15,6 +15,8 @@
 
 #include <math.h>
 #include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
 
 void generate_gradient(uint8_t* pixels, int width, int height,
                       int start_r, int start_g, int start_b,
@@ -39,21 +41,62 @@ void generate_gradient(uint8_t* pixels, int width, int height,
     double range = max_coord - min_coord;
     if (range == 0) range = 1.0;
 
+    // Every pixel on the same projection line gets the same colour, so
+    // interpolate once per quarter-pixel step along the gradient axis and
+    // turn the per-pixel work into a table lookup.
+    int lut_size = (int)ceil(range * 4) + 1;
+    uint8_t* lut = malloc((size_t)lut_size * 4);
+    if (!lut) {
+        // No room for the table, so interpolate every pixel directly
+        for (int y = 0; y < height; y++) {
+            for (int x = 0; x < width; x++) {
+                double coord = x * cos_angle + y * sin_angle;
+                double t = (coord - min_coord) / range;
+
+                // Clamp t to [0, 1]
+                if (t < 0) t = 0;
+                if (t > 1) t = 1;
+
+                size_t idx = ((size_t)y * width + x) * 4;
+                pixels[idx] = (uint8_t)(start_r + (end_r - start_r) * t);     // R
+                pixels[idx + 1] = (uint8_t)(start_g + (end_g - start_g) * t); // G
+                pixels[idx + 2] = (uint8_t)(start_b + (end_b - start_b) * t); // B
+                pixels[idx + 3] = 255;                                        // A
+            }
+        }
+        return;
+    }
+
+    for (int i = 0; i < lut_size; i++) {
+        double t = (double)i / (lut_size - 1);
+        lut[i * 4] = (uint8_t)(start_r + (end_r - start_r) * t);     // R
+        lut[i * 4 + 1] = (uint8_t)(start_g + (end_g - start_g) * t); // G
+        lut[i * 4 + 2] = (uint8_t)(start_b + (end_b - start_b) * t); // B
+        lut[i * 4 + 3] = 255;                                        // A
+    }
+
+    double scale = (lut_size - 1) / range;
+    double step = cos_angle * scale;
+
+    // Rows are independent, so split them across threads once the image is
+    // large enough for that to outweigh the cost of waking the thread pool.
+#ifdef _OPENMP
+    #pragma omp parallel for schedule(static) if ((long)width * height >= 65536)
+#endif
     for (int y = 0; y < height; y++) {
+        double row_start = (y * sin_angle - min_coord) * scale + 0.5;
+        uint8_t* row = pixels + (size_t)y * width * 4;
+
         for (int x = 0; x < width; x++) {
-            double coord = x * cos_angle + y * sin_angle;
-            double t = (coord - min_coord) / range;
-
-            // Clamp t to [0, 1]
-            if (t < 0) t = 0;
-            if (t > 1) t = 1;
-
-            int idx = (y * width + x) * 4;
-            pixels[idx] = (uint8_t)(start_r + (end_r - start_r) * t);     // R
-            pixels[idx + 1] = (uint8_t)(start_g + (end_g - start_g) * t); // G
-            pixels[idx + 2] = (uint8_t)(start_b + (end_b - start_b) * t); // B
-            pixels[idx + 3] = 255;                                        // A
+            int i = (int)(row_start + x * step);
+
+            // Clamp against rounding at the corners
+            if (i < 0) i = 0;
+            if (i >= lut_size) i = lut_size - 1;
+
+            memcpy(row + x * 4, lut + i * 4, 4);
         }
     }
-}
 
+    free(lut);
+}
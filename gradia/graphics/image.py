@@ -15,18 +15,21 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Callable
 from gi.repository import Gtk, Gdk, Adw, GdkPixbuf, GLib, Gio
 from PIL import Image
 from gradia.graphics.background import Background
-import threading
-import tempfile
 import os
 
 class ImageBackground(Background):
+    _MAX_CACHE_SIZE: int = 8
+
     def __init__(self, file_path: Optional[str] = None) -> None:
         self.file_path: Optional[str] = file_path
         self.image: Optional[Image.Image] = None
+        self._resized_cache: OrderedDict[tuple[int, int], bytes] = OrderedDict()
 
         if file_path:
             self.load_image(file_path)
@@ -38,36 +41,53 @@ class ImageBackground(Background):
         except Exception as e:
             self.image = None
             print(f"Error loading image: {e}")
+        self._resized_cache.clear()
 
     def prepare_image(self, width: int, height: int) -> Optional[Image.Image]:
-        if not self.image:
-            return None
-
+        # load_image() runs on the selector's executor, so work from one
+        # snapshot of the source for the whole call.
         img = self.image
-        img_ratio = img.width / img.height
-        target_ratio = width / height
+        if not img:
+            return None
 
-        if img_ratio > target_ratio:
-            new_height = height
-            new_width = int(new_height * img_ratio)
+        cache_key = (width, height)
+        pixels = self._resized_cache.get(cache_key)
+        if pixels is None:
+            pixels = self._resize_and_crop(img, width, height).tobytes()
+            # Don't file the old image's pixels under a newly loaded one
+            if img is self.image:
+                while len(self._resized_cache) >= self._MAX_CACHE_SIZE:
+                    self._resized_cache.popitem(last=False)
+                self._resized_cache[cache_key] = pixels
         else:
-            new_width = width
-            new_height = int(new_width / img_ratio)
-
-        img_resized = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-        left = (new_width - width) // 2
-        top = (new_height - height) // 2
-        right = left + width
-        bottom = top + height
-
-        img_cropped = img_resized.crop((left, top, right, bottom))
-        return img_cropped
+            self._resized_cache.move_to_end(cache_key)
+
+        # Read-only view, PIL copies it on the first write
+        return Image.frombuffer('RGBA', (width, height), pixels, 'raw', 'RGBA', 0, 1)
+
+    def _resize_and_crop(self, img: Image.Image, width: int, height: int) -> Image.Image:
+        # Resample only the part of the source that survives the centred
+        # crop, straight to the target size.
+        scale = max(width / img.width, height / img.height)
+        crop_width = width / scale
+        crop_height = height / scale
+        left = (img.width - crop_width) / 2
+        top = (img.height - crop_height) / 2
+
+        return img.resize(
+            (width, height),
+            Image.Resampling.LANCZOS,
+            box=(left, top, left + crop_width, top + crop_height),
+            reducing_gap=3.0
+        )
 
     def get_name(self) -> str:
         return f"image-{self.file_path or 'none'}"
 
 
 class ImageSelector:
+    _executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 2))
+
     def __init__(
         self,
         image_background: ImageBackground,
@@ -159,8 +179,7 @@ class ImageSelector:
                 GLib.idle_add(self._on_image_loaded)
             except Exception as e:
                 print(f"Error loading image: {e}")
-        thread = threading.Thread(target=load_in_background, daemon=True)
-        thread.start()
+        self._executor.submit(load_in_background)
 
     def _on_image_loaded(self) -> None:
         self._update_preview()
@@ -169,38 +188,33 @@ class ImageSelector:
 
     def _update_preview(self) -> None:
         if self.image_background.image:
-            def save_and_update():
+            def build_preview():
                 try:
-                    image = self.image_background.image.copy()
+                    image = self.image_background.image
 
                     max_width = 400
                     if image.width > max_width:
                         ratio = max_width / image.width
                         new_size = (int(image.width * ratio), int(image.height * ratio))
-                        image = image.resize(new_size, Image.LANCZOS)
-
-                    with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as temp_file:
-                        temp_path = temp_file.name
-                        image.save(temp_path, 'PNG')
-
-                    GLib.idle_add(self._set_preview_image, temp_path)
+                        image = image.resize(new_size, Image.LANCZOS, reducing_gap=3.0)
+
+                    pixbuf = GdkPixbuf.Pixbuf.new_from_bytes(
+                        GLib.Bytes.new(image.tobytes()),
+                        GdkPixbuf.Colorspace.RGB,
+                        True, 8,
+                        image.width, image.height,
+                        image.width * 4
+                    )
+                    texture = Gdk.Texture.new_for_pixbuf(pixbuf)
+
+                    GLib.idle_add(self._set_preview_texture, texture)
                 except Exception as e:
-                    print(f"Error saving preview: {e}")
+                    print(f"Error creating preview: {e}")
 
-            thread = threading.Thread(target=save_and_update, daemon=True)
-            thread.start()
+            self._executor.submit(build_preview)
         else:
             self.preview_picture.set_paintable(None)
 
-    def _set_preview_image(self, temp_path: str) -> None:
-        self.preview_picture.set_filename(temp_path)
-        def cleanup_temp_file():
-            try:
-                os.unlink(temp_path)
-            except Exception:
-                pass
-            return False
-
-        GLib.timeout_add(100, cleanup_temp_file)
+    def _set_preview_texture(self, texture: Gdk.Texture) -> bool:
+        self.preview_picture.set_paintable(texture)
         return False
-
@@ -16,23 +16,23 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 import os
-import io
+from collections import OrderedDict
 from typing import Optional
-from PIL import Image, ImageDraw, ImageChops, ImageFilter, ImageOps
-from gi.repository import GdkPixbuf
+from PIL import Image, ImageDraw, ImageChops, ImageFilter
+from gi.repository import GdkPixbuf, GLib
 
 class ImageProcessor:
 
     MAX_DIMESION = 1440
-    MAX_FILE_SIZE = 1000 * 1024
+    _MAX_CACHE_SIZE = 8
+    _source_cache: OrderedDict[tuple[str, int], Image.Image] = OrderedDict()
 
-    
     def __init__(
         self,
         image_path: Optional[str] = None,
         background: Optional[object] = None,
         padding: int = 5,
-        aspect_ratio: Optional[str | float] = None,
+        aspect_ratio: Optional[float] = None,
         corner_radius: int = 2,
         shadow_strength: float = 0.0
     ) -> None:
@@ -42,20 +42,49 @@ class ImageProcessor:
         self.aspect_ratio = aspect_ratio
         self.corner_radius = corner_radius
         self.source_img: Optional[Image.Image] = None
-        self._loaded_image_path: Optional[str] = None
+        self._loaded_image_key: Optional[tuple[str, int]] = None
 
         if image_path:
             self.set_image_path(image_path)
 
+    # The window parses the "16:9" entry text; a ratio that cannot be used
+    # is dropped here so process() never has to guard the division.
+    @property
+    def aspect_ratio(self) -> Optional[float]:
+        return self._aspect_ratio
+
+    @aspect_ratio.setter
+    def aspect_ratio(self, value: Optional[float]) -> None:
+        self._aspect_ratio: Optional[float] = float(value) if value and value > 0 else None
+
     def _get_percentage(self, value: float) -> float:
         return value / 100.0
 
     def set_image_path(self, image_path: str) -> None:
-        if image_path != self._loaded_image_path:
-            if not os.path.exists(image_path):
-                raise FileNotFoundError(f"Input image not found: {image_path}")
-            self.source_img = self._load_and_downscale_image(image_path)
-            self._loaded_image_path = image_path
+        loaded_path = self._loaded_image_key[0] if self._loaded_image_key else None
+        try:
+            # The mtime catches files rewritten in place, like the clipboard
+            # import that always lands on the same temp path.
+            cache_key = (image_path, os.stat(image_path).st_mtime_ns)
+        except OSError:
+            # A source that was moved or deleted after loading stays usable
+            if image_path == loaded_path and self.source_img is not None:
+                return
+            raise FileNotFoundError(f"Input image not found: {image_path}")
+        if cache_key == self._loaded_image_key:
+            return
+
+        source_img = self._source_cache.get(cache_key)
+        if source_img is None:
+            while len(self._source_cache) >= self._MAX_CACHE_SIZE:
+                self._source_cache.popitem(last=False)
+            source_img = self._load_and_downscale_image(image_path)
+            self._source_cache[cache_key] = source_img
+        else:
+            self._source_cache.move_to_end(cache_key)
+
+        self.source_img = source_img
+        self._loaded_image_key = cache_key
 
     def process(self) -> GdkPixbuf.Pixbuf:
         if not self.source_img:
@@ -75,9 +104,10 @@ class ImageProcessor:
         final_img = self._create_background(padded_width, padded_height)
         paste_position = self._get_paste_position(width, height, padded_width, padded_height)
 
-        shadow_img, shadow_offset = self._create_shadow(source_img, offset=(10, 10), shadow_strength=self.shadow_strength)
-        shadow_pos = (paste_position[0] - shadow_offset[0], paste_position[1] - shadow_offset[1])
-        final_img = self._alpha_composite_at_position(final_img, shadow_img, shadow_pos)
+        if self.shadow_strength > 0:
+            shadow_img, shadow_offset = self._create_shadow(source_img, offset=(10, 10), shadow_strength=self.shadow_strength)
+            shadow_pos = (paste_position[0] - shadow_offset[0], paste_position[1] - shadow_offset[1])
+            final_img = self._alpha_composite_at_position(final_img, shadow_img, shadow_pos)
 
         final_img = self._alpha_composite_at_position(final_img, source_img, paste_position)
 
@@ -88,11 +118,21 @@ class ImageProcessor:
             background = background.convert('RGBA')
         if foreground.mode != 'RGBA':
             foreground = foreground.convert('RGBA')
-        temp_canvas = Image.new('RGBA', background.size, (0, 0, 0, 0))
-        temp_canvas.paste(foreground, position, foreground)
-        result = Image.alpha_composite(background, temp_canvas)
 
-        return result
+        # Paste the foreground through its own alpha first; the soft edges
+        # and the shadow are tuned for that darker, squared falloff.
+        layer = Image.new('RGBA', foreground.size, (0, 0, 0, 0))
+        layer.paste(foreground, (0, 0), foreground)
+
+        # alpha_composite() clips on the far edges but rejects a negative
+        # destination, so trim the overhang on the near edges here.
+        x, y = position
+        left, top = max(0, -x), max(0, -y)
+        if left >= layer.width or top >= layer.height:
+            return background
+
+        background.alpha_composite(layer, dest=(x + left, y + top), source=(left, top))
+        return background
 
     def _load_and_downscale_image(self, image_path: str) -> Image.Image:
         source_img = Image.open(image_path).convert("RGBA")
@@ -100,23 +140,8 @@ class ImageProcessor:
         if self._needs_downscaling(source_img):
             source_img = self._downscale_image(source_img)
 
-        quality = 100
-        source_img, compressed_size = self._compress_image_with_size(source_img, quality)
-
-        while compressed_size > self.MAX_FILE_SIZE and quality > 10:
-            quality -= 10
-            source_img, compressed_size = self._compress_image_with_size(source_img, quality)
-
         return source_img
 
-    def _compress_image_with_size(self, image: Image.Image, quality: int) -> tuple[Image.Image, int]:
-        buffer = io.BytesIO()
-        image.save(buffer, format='PNG', optimize=True, quality=quality)
-        size = buffer.tell()
-        buffer.seek(0)
-        compressed = Image.open(buffer).convert("RGBA")
-        return compressed, size
-
     def _needs_downscaling(self, image: Image.Image) -> bool:
         width, height = image.size
         return width > self.MAX_DIMESION or height > self.MAX_DIMESION
@@ -129,7 +154,7 @@ class ImageProcessor:
         else:
             new_height = self.MAX_DIMESION
             new_width = int(width * (self.MAX_DIMESION / height))
-        return image.resize((new_width, new_height), Image.Resampling.LANCZOS)
+        return image.resize((new_width, new_height), Image.Resampling.LANCZOS, reducing_gap=3.0)
 
     def _crop_image(self, image: Image.Image) -> Image.Image:
         width, height = image.size
@@ -156,44 +181,59 @@ class ImageProcessor:
         return width, height
 
     def _adjust_for_aspect_ratio(self, width: int, height: int) -> tuple[int, int]:
-        try:
-            ratio = self._parse_aspect_ratio()
-            current = width / height
-
-            if current < ratio:
-                width = int(height * ratio)
-            elif current > ratio:
-                height = int(width / ratio)
-
-            return width, height
-        except Exception:
-            return width, height
-
-    def _parse_aspect_ratio(self) -> float:
-        if isinstance(self.aspect_ratio, str) and ":" in self.aspect_ratio:
-            w, h = map(float, self.aspect_ratio.split(":"))
-            return w / h
-        if self.aspect_ratio:
-            return float(self.aspect_ratio)
-        raise ValueError("aspect_ratio is None and cannot be converted to float")
+        ratio = self._aspect_ratio
+        current = width / height
+
+        if current < ratio:
+            width = int(height * ratio)
+        elif current > ratio:
+            height = int(width / ratio)
+
+        return width, height
 
     def _apply_rounded_corners(self, image: Image.Image) -> Image.Image:
         width, height = image.size
         smaller_dimension = min(width, height)
         radius_percentage = self._get_percentage(self.corner_radius)
         radius_pixels = int(radius_percentage * smaller_dimension)
+        if radius_pixels <= 0:
+            return image
+
+        # Only the corners need antialiasing, so oversample just those
+        # tiles (plus a little room for the Lanczos support) and leave the
+        # rest of the alpha channel alone.
         oversample = 4
-        large_mask = Image.new("L", (width * oversample, height * oversample), 0)
-        draw = ImageDraw.Draw(large_mask)
-        draw.rounded_rectangle(
-            (0, 0, width * oversample, height * oversample),
-            radius=radius_pixels * oversample,
-            fill=255
-        )
-        mask = large_mask.resize((width, height), Image.LANCZOS)
-        r, g, b, alpha = image.split()
-        new_alpha = ImageChops.multiply(alpha, mask)
-        return Image.merge("RGBA", (r, g, b, new_alpha))
+        tile = min(radius_pixels + 2, width, height)
+        corner_boxes = [
+            (x, y, x + tile, y + tile)
+            for x, y in ((0, 0), (width - tile, 0), (0, height - tile), (width - tile, height - tile))
+        ]
+        corners = []
+
+        for x, y, _, _ in corner_boxes:
+            large_tile = Image.new("L", (tile * oversample, tile * oversample), 0)
+            draw = ImageDraw.Draw(large_tile)
+            draw.rounded_rectangle(
+                (-x * oversample, -y * oversample, (width - x) * oversample, (height - y) * oversample),
+                radius=radius_pixels * oversample,
+                fill=255
+            )
+            corners.append(large_tile.resize((tile, tile), Image.LANCZOS))
+
+        # process() hands over its own copy, so the alpha is updated in place
+        if 2 * tile <= width and 2 * tile <= height:
+            for box, corner in zip(corner_boxes, corners):
+                region = image.crop(box)
+                region.putalpha(ImageChops.multiply(region.getchannel("A"), corner))
+                image.paste(region, box)
+        else:
+            # Large radii make the tiles overlap; merge them into one mask
+            mask = Image.new("L", (width, height), 255)
+            for box, corner in zip(corner_boxes, corners):
+                mask.paste(ImageChops.darker(mask.crop(box), corner), box)
+            image.putalpha(ImageChops.multiply(image.getchannel("A"), mask))
+
+        return image
 
     def _create_background(self, width: int, height: int) -> Image.Image:
         if self.background:
@@ -203,23 +243,35 @@ class ImageProcessor:
     def _create_shadow(self, image: Image.Image, offset: tuple[int, int] = (10, 10), shadow_strength: float = 1.0) -> tuple[Image.Image, tuple[int, int]]:
         shadow_strength = max(0.0, min(shadow_strength, 10)) /5
         blur_radius = int(10 * shadow_strength)
-        shadow_alpha = int(150 * shadow_strength)
-        shadow_color = (0, 0, 0, shadow_alpha)
-
-        alpha = image.split()[3]
-        shadow = Image.new("RGBA", image.size, shadow_color)
-        shadow.putalpha(alpha)
 
         extra_margin = blur_radius * 5
         expanded_width = image.width + abs(offset[0]) + extra_margin
         expanded_height = image.height + abs(offset[1]) + extra_margin
-        shadow_canvas = Image.new("RGBA", (expanded_width, expanded_height), (0, 0, 0, 0))
 
         shadow_x = extra_margin // 2 + max(offset[0], 0)
         shadow_y = extra_margin // 2 + max(offset[1], 0)
-        shadow_canvas.paste(shadow, (shadow_x, shadow_y), shadow)
 
-        shadow_canvas = shadow_canvas.filter(ImageFilter.GaussianBlur(blur_radius))
+        # The shadow is plain black, so only its alpha needs blurring
+        alpha = image.getchannel("A")
+        shadow_mask = Image.new("L", (expanded_width, expanded_height), 0)
+        shadow_mask.paste(alpha, (shadow_x, shadow_y), alpha)
+
+        # A wide blur has no fine detail left to lose, so run it on a
+        # reduced copy and scale the result back up.
+        factor = max(1, min(4, blur_radius // 3))
+        if factor > 1:
+            small_mask = shadow_mask.reduce(factor)
+            small_mask = small_mask.filter(ImageFilter.GaussianBlur(blur_radius / factor))
+            shadow_mask = small_mask.resize(
+                (expanded_width, expanded_height),
+                Image.Resampling.BILINEAR,
+                box=(0, 0, expanded_width / factor, expanded_height / factor)
+            )
+        else:
+            shadow_mask = shadow_mask.filter(ImageFilter.GaussianBlur(blur_radius))
+
+        shadow_canvas = Image.new("RGBA", (expanded_width, expanded_height), (0, 0, 0, 0))
+        shadow_canvas.putalpha(shadow_mask)
         return shadow_canvas, (shadow_x, shadow_y)
 
     def _get_paste_position(self, img_w: int, img_h: int, bg_w: int, bg_h: int) -> tuple[int, int]:
@@ -234,9 +286,9 @@ class ImageProcessor:
             image = image.convert('RGBA')
 
         width, height = image.size
-        pixels = image.tobytes()
+        pixels = GLib.Bytes.new(image.tobytes())
 
-        pixbuf = GdkPixbuf.Pixbuf.new_from_data(
+        pixbuf = GdkPixbuf.Pixbuf.new_from_bytes(
             pixels,
             GdkPixbuf.Colorspace.RGB,
             True,  # has_alpha=True
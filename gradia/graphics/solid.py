@@ -20,6 +20,7 @@ from typing import Optional
 from PIL import Image
 from gi.repository import Gtk, Gdk, Adw
 from gradia.graphics.background import Background
+from gradia.graphics.gradient import hex_to_rgb
 
 
 class SolidBackground(Background):
@@ -31,12 +32,8 @@ class SolidBackground(Background):
     def get_name(self) -> str:
         return f"solid-{self.color}-{self.alpha}"
 
-    def _hex_to_rgb(self, hex_color: str) -> tuple[int, int, int]:
-        hex_color = hex_color.lstrip('#')
-        return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-
     def prepare_image(self, width: int, height: int) -> Image.Image:
-        rgb = self._hex_to_rgb(self.color)
+        rgb = hex_to_rgb(self.color)
         alpha_value = int(self.alpha * 255)
         return Image.new('RGBA', (width, height), (*rgb, alpha_value))
 
@@ -57,6 +54,55 @@ class SolidSelector:
         "#00000000"
     ]
 
+    _css_installed: bool = False
+
+    @staticmethod
+    def _split_hex_alpha(color: str) -> tuple[str, float]:
+        hex_color = color.lstrip('#')
+        if len(hex_color) == 8:
+            return hex_color[2:], int(hex_color[:2], 16) / 255.0
+        return hex_color, 1.0
+
+    @classmethod
+    def _install_swatch_css(cls) -> None:
+        if cls._css_installed:
+            return
+
+        css = ""
+        for index, color in enumerate(cls.COMMON_COLORS):
+            rgb_hex, alpha_from_hex = cls._split_hex_alpha(color)
+            if alpha_from_hex == 0.0:
+                css += f"""
+                button.solid-swatch-{index} {{
+                    background: linear-gradient(45deg, {cls.CHECKER_DARK} 25%, transparent 25%),
+                                linear-gradient(-45deg, {cls.CHECKER_DARK} 25%, transparent 25%),
+                                linear-gradient(45deg, transparent 75%, {cls.CHECKER_DARK} 75%),
+                                linear-gradient(-45deg, transparent 75%, {cls.CHECKER_DARK} 75%);
+                    background-size: 20px 20px;
+                    background-position: 0 0, 0 10px, 10px -10px, -10px 0px;
+                    border-radius: 50%;
+                    border: 1px solid @borders;
+                }}
+                """
+            else:
+                rgba = cls._hex_alpha_to_rgba(f"#{rgb_hex}", alpha_from_hex)
+                css += f"""
+                button.solid-swatch-{index} {{
+                    background-color: {rgba.to_string()};
+                    border-radius: 50%;
+                    border: 1px solid @borders;
+                }}
+                """
+
+        style_provider = Gtk.CssProvider()
+        style_provider.load_from_string(css)
+        Gtk.StyleContext.add_provider_for_display(
+            Gdk.Display.get_default(),
+            style_provider,
+            Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
+        )
+        cls._css_installed = True
+
     def __init__(
         self,
         solid: SolidBackground,
@@ -65,6 +111,7 @@ class SolidSelector:
         self.solid = solid
         self.callback = callback
         self.color_button: Optional[Gtk.ColorButton] = None
+        self._install_swatch_css()
         self.widget = self._build()
 
     def _build(self) -> Adw.PreferencesGroup:
@@ -101,42 +148,8 @@ class SolidSelector:
             button.set_size_request(32, 32)
             button.set_margin_top(7)
             button.set_margin_bottom(6.95)
-            hex_color = color.lstrip('#')
-            if len(hex_color) == 8:
-                alpha_from_hex = int(hex_color[:2], 16) / 255.0
-                rgb_hex = hex_color[2:]
-            else:
-                alpha_from_hex = 1.0
-                rgb_hex = hex_color
-            if alpha_from_hex == 0.0:
-                css = f"""
-                button {{
-                    background: linear-gradient(45deg, {self.CHECKER_DARK} 25%, transparent 25%),
-                                linear-gradient(-45deg, {self.CHECKER_DARK} 25%, transparent 25%),
-                                linear-gradient(45deg, transparent 75%, {self.CHECKER_DARK} 75%),
-                                linear-gradient(-45deg, transparent 75%, {self.CHECKER_DARK} 75%);
-                    background-size: 20px 20px;
-                    background-position: 0 0, 0 10px, 10px -10px, -10px 0px;
-                    border-radius: 50%;
-                    border: 1px solid @borders;
-                }}
-                """
-            else:
-                rgba = self._hex_alpha_to_rgba(f"#{rgb_hex}", alpha_from_hex)
-                css = f"""
-                button {{
-                    background-color: {rgba.to_string()};
-                    border-radius: 50%;
-                    border: 1px solid @borders;
-                }}
-                """
-            style_provider = Gtk.CssProvider()
-            style_provider.load_from_data(css.encode())
-            Gtk.StyleContext.add_provider(
-                button.get_style_context(),
-                style_provider,
-                Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-            )
+            button.add_css_class(f"solid-swatch-{index}")
+            rgb_hex, alpha_from_hex = self._split_hex_alpha(color)
             button.connect("clicked", self._on_common_color_clicked, f"#{rgb_hex}", alpha_from_hex)
             row_pos = index // columns
             col_pos = index % columns
@@ -159,7 +172,8 @@ class SolidSelector:
         if self.callback:
             self.callback(self.solid)
 
-    def _hex_alpha_to_rgba(self, hex_color: str, alpha: float) -> Gdk.RGBA:
+    @staticmethod
+    def _hex_alpha_to_rgba(hex_color: str, alpha: float) -> Gdk.RGBA:
         rgba = Gdk.RGBA()
         rgba.parse(hex_color)
         rgba.alpha = alpha
@@ -40,7 +40,8 @@ class GradiaApp(Adw.Application):
         )
         self.version = version
         self.screenshot_flags: Optional[Xdp.ScreenshotFlags] = None
-        self.temp_dirs: list[str] = []
+        self.temp_root: Optional[str] = None
+        self.window_count: int = 0
 
         self.load_css()
 
@@ -50,24 +51,29 @@ class GradiaApp(Adw.Application):
     def do_command_line(self, command_line: Gio.ApplicationCommandLine) -> int:
         args = command_line.get_arguments()[1:]
 
-        logging.debug(f"Command line arguments: {args}")
+        logging.debug("Command line arguments: %s", args)
 
-        self.screenshot_flags = self._parse_screenshot_flag(args)
+        screenshot_flags: Optional[Xdp.ScreenshotFlags] = None
         files_to_open = []
 
         for arg in args:
-            if not arg.startswith("--"):
+            if arg.startswith("--screenshot"):
+                if screenshot_flags is None:
+                    screenshot_flags = self._parse_screenshot_flag(arg)
+            elif not arg.startswith("--"):
                 try:
                     file = Gio.File.new_for_commandline_arg(arg)
                     path = file.get_path()
                     if path:
                         files_to_open.append(path)
-                        logging.debug(f"File to open detected: {path}")
+                        logging.debug("File to open detected: %s", path)
                     else:
                         logging.warning(f"Argument {arg} does not have a valid path.")
                 except Exception as e:
                     logging.warning(f"Failed to parse file URI {arg}.", exception=e, show_exception=True)
 
+        self.screenshot_flags = screenshot_flags
+
         if files_to_open:
             for path in files_to_open:
                 self._open_window(path)
@@ -87,28 +93,25 @@ class GradiaApp(Adw.Application):
             Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
         )
 
-    def _parse_screenshot_flag(self, args: list[str]) -> Optional[Xdp.ScreenshotFlags]:
-        for arg in args:
-            if arg.startswith("--screenshot"):
-                if "=" in arg:
-                    mode = arg.split("=", 1)[1].strip().upper()
-                else:
-                    mode = "INTERACTIVE"
-                if mode == "INTERACTIVE":
-                    return Xdp.ScreenshotFlags.INTERACTIVE
-                elif mode == "FULL":
-                    return Xdp.ScreenshotFlags.NONE
-                else:
-                    logging.warning(f"Unknown screenshot mode: {mode}. Defaulting to INTERACTIVE.")
-                    return Xdp.ScreenshotFlags.INTERACTIVE
-        return None
+    def _parse_screenshot_flag(self, arg: str) -> Xdp.ScreenshotFlags:
+        if "=" in arg:
+            mode = arg.split("=", 1)[1].strip().upper()
+        else:
+            mode = "INTERACTIVE"
+        if mode == "INTERACTIVE":
+            return Xdp.ScreenshotFlags.INTERACTIVE
+        elif mode == "FULL":
+            return Xdp.ScreenshotFlags.NONE
+        else:
+            logging.warning(f"Unknown screenshot mode: {mode}. Defaulting to INTERACTIVE.")
+            return Xdp.ScreenshotFlags.INTERACTIVE
 
     def do_open(self, files: Sequence[Gio.File], hint: str):
-        logging.debug(f"do_open called with files: {[file.get_path() for file in files]} and hint: {hint}")
+        logging.debug("do_open called with %d files and hint: %s", len(files), hint)
         for file in files:
             path = file.get_path()
             if path:
-                logging.debug(f"Opening file from do_open: {path}")
+                logging.debug("Opening file from do_open: %s", path)
                 self._open_window(path)
 
     def do_activate(self):
@@ -116,13 +119,12 @@ class GradiaApp(Adw.Application):
         self._open_window(None)
 
     def _open_window(self, file_path: Optional[str]):
-        logging.debug(f"Opening window with file_path={file_path}, screenshot_flags={self.screenshot_flags}")
-        temp_dir = tempfile.mkdtemp()
-        logging.debug(f"Created temp directory: {temp_dir}")
-        self.temp_dirs.append(temp_dir)
+        logging.debug("Opening window with file_path=%s, screenshot_flags=%s", file_path, self.screenshot_flags)
+        # Each window gets its own folder, only created once it writes a file
+        self.window_count += 1
 
         window = GradientWindow(
-            temp_dir=temp_dir,
+            temp_dir_name=f"window-{self.window_count}",
             version=self.version,
             application=self,
             init_screenshot_mode=self.screenshot_flags,
@@ -133,15 +135,24 @@ class GradiaApp(Adw.Application):
             # Do not yet show the window if triggered from the shortcut.
             window.show()
 
+    def get_temp_dir(self, name: str) -> str:
+        if self.temp_root is None:
+            self.temp_root = tempfile.mkdtemp(prefix="gradia-")
+            logging.debug("Created temp directory: %s", self.temp_root)
+
+        temp_dir = os.path.join(self.temp_root, name)
+        os.makedirs(temp_dir, exist_ok=True)
+        return temp_dir
+
     def on_shutdown(self, application):
         logging.info("Application shutdown started, cleaning temp directories...")
-        for temp_dir in self.temp_dirs:
+        if self.temp_root is not None:
             try:
-                if os.path.exists(temp_dir):
-                    shutil.rmtree(temp_dir)
-                    logging.debug(f"Deleted temp dir: {temp_dir}")
+                if os.path.exists(self.temp_root):
+                    shutil.rmtree(self.temp_root)
+                    logging.debug("Deleted temp dir: %s", self.temp_root)
             except Exception as e:
-                logging.warning(f"Failed to clean up temp dir {temp_dir}.", exception=e, show_exception=True)
+                logging.warning(f"Failed to clean up temp dir {self.temp_root}.", exception=e, show_exception=True)
         logging.info("Cleanup complete.")
 
 
@@ -15,17 +15,39 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-from gi.repository import Gtk, Gdk, Gio, cairo, Pango, PangoCairo, GdkPixbuf
+from gi.repository import Gtk, Gdk, Gio, GLib, cairo, Pango, PangoCairo, GdkPixbuf
 from enum import Enum
+from functools import lru_cache
 import math
 from gradia.backend.logger import Logger
 import time
 import random
+import cairo as cairo_lib
 
 logging = Logger()
 
 start_time_seed = int(time.time())
 
+# Text is measured off-screen; one tiny surface serves every measurement
+_measure_cr = cairo_lib.Context(cairo_lib.ImageSurface(cairo_lib.Format.ARGB32, 1, 1))
+
+@lru_cache(maxsize=32)
+def _font_description(family: str, size: int) -> Pango.FontDescription:
+    # Layouts copy the description they are given, so one can be shared
+    font_desc = Pango.FontDescription()
+    font_desc.set_family(family)
+    font_desc.set_size(size)
+    return font_desc
+
+@lru_cache(maxsize=512)
+def _measure_text(text: str, family: str, size: int) -> tuple[float, float]:
+    layout = PangoCairo.create_layout(_measure_cr)
+    layout.set_font_description(_font_description(family, size))
+    layout.set_text(text, -1)
+
+    _, logical_rect = layout.get_extents()
+    return logical_rect.width / Pango.SCALE, logical_rect.height / Pango.SCALE
+
 class DrawingMode(Enum):
     PEN = _("Pen")
     ARROW = _("Arrow")
@@ -39,6 +61,8 @@ class DrawingMode(Enum):
     NUMBER = _("Number")
 
 class DrawingAction:
+    __slots__ = ()
+
     DEFAULT_PADDING = 0.02
 
     def draw(self, cr: cairo.Context, image_to_widget_coords, scale: float):
@@ -54,51 +78,78 @@ class DrawingAction:
 
     def contains_point(self, x, y):
         min_x, min_y, max_x, max_y = self.get_bounds()
-        if isinstance(self, (LineAction, ArrowAction)):
-            px, py = x, y
-            x1, y1 = self.start
-            x2, y2 = self.end
-            line_len_sq = (x2 - x1) ** 2 + (y2 - y1) ** 2
-            if line_len_sq == 0:
-                return math.hypot(px - x1, py - y1) < self.DEFAULT_PADDING
-            t = ((px - x1) * (x2 - x1) + (py - y1) * (y2 - y1)) / line_len_sq
-            t = max(0, min(1, t))
-            closest_x = x1 + t * (x2 - x1)
-            closest_y = y1 + t * (y2 - y1)
-            dist_sq = (px - closest_x)**2 + (py - closest_y)**2
-            return dist_sq < (0.01 + self.width / 200.0)**2
         return min_x <= x <= max_x and min_y <= y <= max_y
 
     def translate(self, dx, dy):
         raise NotImplementedError
 
 class StrokeAction(DrawingAction):
-    def __init__(self, stroke, color, pen_size):
+    __slots__ = ('stroke', 'color', 'pen_size', '_bounds', '_cache_path', '_path_key', '_path')
+
+    def __init__(self, stroke, color, pen_size, cache_path=True):
         self.stroke = stroke
         self.color = color
         self.pen_size = pen_size
+        # Live previews are rebuilt every frame, so they skip the path cache
+        self._cache_path = cache_path
+        # Measured on first query; live previews are drawn but never queried
+        self._bounds = None
+        self._path_key = None
+        self._path = None
 
     def draw(self, cr, image_to_widget_coords, scale):
         if len(self.stroke) < 2:
             return
-        coords = [image_to_widget_coords(x, y) for x, y in self.stroke]
         cr.set_source_rgba(*self.color)
         cr.set_line_width(self.pen_size * scale)
-        cr.move_to(*coords[0])
-        for point in coords[1:]:
-            cr.line_to(*point)
+        self._append_path(cr, image_to_widget_coords)
         cr.stroke()
 
-    def get_bounds(self):
+    def _append_path(self, cr, image_to_widget_coords):
+        # The widget transform is affine, so two corners identify it; while
+        # it holds, replay the path cairo built last time in one call.
+        path_key = (image_to_widget_coords(0, 0), image_to_widget_coords(1, 1))
+        if self._path_key == path_key:
+            cr.append_path(self._path)
+            return
+
+        (origin_x, origin_y), (corner_x, corner_y) = path_key
+        if origin_x == corner_x or origin_y == corner_y:
+            return
+
+        # Let cairo apply the transform instead of calling back per point
+        cr.save()
+        cr.translate(origin_x, origin_y)
+        cr.scale(corner_x - origin_x, corner_y - origin_y)
+        cr.move_to(*self.stroke[0])
+        for point in self.stroke[1:]:
+            cr.line_to(*point)
+        cr.restore()
+        if self._cache_path:
+            self._path = cr.copy_path()
+            self._path_key = path_key
+
+    def _measure_stroke(self):
         if not self.stroke:
             return (0, 0, 0, 0)
         xs, ys = zip(*self.stroke)
         return self.apply_padding((min(xs), min(ys), max(xs), max(ys)))
 
+    def get_bounds(self):
+        if self._bounds is None:
+            self._bounds = self._measure_stroke()
+        return self._bounds
+
     def translate(self, dx, dy):
         self.stroke = [(x + dx, y + dy) for x, y in self.stroke]
+        self._path_key = None
+        if self.stroke and self._bounds is not None:
+            min_x, min_y, max_x, max_y = self._bounds
+            self._bounds = (min_x + dx, min_y + dy, max_x + dx, max_y + dy)
 
 class ArrowAction(DrawingAction):
+    __slots__ = ('start', 'end', 'color', 'arrow_head_size', 'width')
+
     def __init__(self, start, end, color, arrow_head_size, width):
         self.start = start
         self.end = end
@@ -114,9 +165,6 @@ class ArrowAction(DrawingAction):
             return
         cr.set_source_rgba(*self.color)
         cr.set_line_width(self.width * scale)
-        cr.move_to(start_x, start_y)
-        cr.line_to(end_x, end_y)
-        cr.stroke()
         angle = math.atan2(end_y - start_y, end_x - start_x)
         head_len = min(self.arrow_head_size * scale, distance * 0.3)
         head_angle = math.pi / 6
@@ -124,9 +172,11 @@ class ArrowAction(DrawingAction):
         y1 = end_y - head_len * math.sin(angle - head_angle)
         x2 = end_x - head_len * math.cos(angle + head_angle)
         y2 = end_y - head_len * math.sin(angle + head_angle)
-        cr.move_to(end_x, end_y)
-        cr.line_to(x1, y1)
-        cr.move_to(end_x, end_y)
+        # Shaft and head go out as one path in a single stroke
+        cr.move_to(start_x, start_y)
+        cr.line_to(end_x, end_y)
+        cr.move_to(x1, y1)
+        cr.line_to(end_x, end_y)
         cr.line_to(x2, y2)
         cr.stroke()
 
@@ -137,11 +187,37 @@ class ArrowAction(DrawingAction):
         max_y = max(self.start[1], self.end[1])
         return self.apply_padding((min_x, min_y, max_x, max_y))
 
+    def contains_point(self, x, y):
+        # Lines are hit by distance to the segment, not by their box
+        px, py = x, y
+        x1, y1 = self.start
+        x2, y2 = self.end
+        tolerance = 0.01 + self.width / 200.0
+
+        # Nothing outside the segment's box grown by the hit distance can
+        # be close enough, so skip the projection for those points.
+        reach = max(tolerance, self.DEFAULT_PADDING)
+        if not (min(x1, x2) - reach <= px <= max(x1, x2) + reach and
+                min(y1, y2) - reach <= py <= max(y1, y2) + reach):
+            return False
+
+        line_len_sq = (x2 - x1) ** 2 + (y2 - y1) ** 2
+        if line_len_sq == 0:
+            return math.hypot(px - x1, py - y1) < self.DEFAULT_PADDING
+        t = ((px - x1) * (x2 - x1) + (py - y1) * (y2 - y1)) / line_len_sq
+        t = max(0, min(1, t))
+        closest_x = x1 + t * (x2 - x1)
+        closest_y = y1 + t * (y2 - y1)
+        dist_sq = (px - closest_x)**2 + (py - closest_y)**2
+        return dist_sq < tolerance**2
+
     def translate(self, dx, dy):
         self.start = (self.start[0] + dx, self.start[1] + dy)
         self.end = (self.end[0] + dx, self.end[1] + dy)
 
 class TextAction(DrawingAction):
+    __slots__ = ('position', 'text', 'color', 'font_size', 'font_family', 'image_bounds', '_layout_key', '_layout', '_bounds_key', '_bounds')
+
     def __init__(self, position, text, color, font_size,image_bounds, font_family="Sans"):
         self.position = position
         self.text = text
@@ -149,44 +225,51 @@ class TextAction(DrawingAction):
         self.font_size = font_size
         self.font_family = font_family
         self.image_bounds = image_bounds
+        # Text and font are edited in place, so the cached layout and
+        # bounds remember what they were built for.
+        self._layout_key = None
+        self._layout = None
+        self._bounds_key = None
+        self._bounds = None
 
     def draw(self, cr, image_to_widget_coords, scale):
         if not self.text.strip():
             return
         x, y = image_to_widget_coords(*self.position)
         cr.set_source_rgba(*self.color)
+        layout, text_width, text_height = self._get_layout(cr, scale)
+        cr.move_to(x - text_width / 2, y - text_height)
+        PangoCairo.show_layout(cr, layout)
+
+    def _get_layout(self, cr, scale):
+        size = int(self.font_size * scale * Pango.SCALE)
+        layout_key = (self.text, self.font_family, size)
+        if self._layout_key == layout_key:
+            PangoCairo.update_layout(cr, self._layout[0])
+            return self._layout
+
         layout = PangoCairo.create_layout(cr)
-        font_desc = Pango.FontDescription()
-        font_desc.set_family(self.font_family)
-        font_desc.set_size(int(self.font_size * scale * Pango.SCALE))
-        layout.set_font_description(font_desc)
+        layout.set_font_description(_font_description(self.font_family, size))
         layout.set_text(self.text, -1)
         _, logical_rect = layout.get_extents()
-        text_width = logical_rect.width / Pango.SCALE
-        text_height = logical_rect.height / Pango.SCALE
-        cr.move_to(x - text_width / 2, y - text_height)
-        PangoCairo.show_layout(cr, layout)
+        self._layout = (layout, logical_rect.width / Pango.SCALE, logical_rect.height / Pango.SCALE)
+        self._layout_key = layout_key
+        return self._layout
 
     def get_bounds(self):
+        # Hit tests query this on every pointer motion
+        bounds_key = (self.position, self.text, self.font_family, self.font_size, self.image_bounds)
+        if self._bounds_key != bounds_key:
+            self._bounds = self._measure_bounds()
+            self._bounds_key = bounds_key
+        return self._bounds
+
+    def _measure_bounds(self):
         if not self.text.strip():
             x, y = self.position
             return (x, y, x, y)
 
-        # Create a temporary surface and context to measure text
-        import cairo
-        temp_surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, 1, 1)
-        temp_cr = cairo.Context(temp_surface)
-
-        layout = PangoCairo.create_layout(temp_cr)
-        font_desc = Pango.FontDescription()
-        font_desc.set_family(self.font_family)
-        font_desc.set_size(int(self.font_size * Pango.SCALE))
-        layout.set_font_description(font_desc)
-        layout.set_text(self.text, -1)
-
-        _, logical_rect = layout.get_extents()
-        text_width_px = logical_rect.width / Pango.SCALE
-        text_height_px = logical_rect.height / Pango.SCALE
+        text_width_px, text_height_px = _measure_text(self.text, self.font_family, int(self.font_size * Pango.SCALE))
 
         reference_width = self.image_bounds[0]
         reference_height = self.image_bounds[1]
@@ -206,6 +289,8 @@ class TextAction(DrawingAction):
 
 
 class LineAction(ArrowAction):
+    __slots__ = ()
+
     def draw(self, cr, image_to_widget_coords, scale):
         cr.set_source_rgba(*self.color)
         cr.set_line_width(self.width * scale)
@@ -214,6 +299,8 @@ class LineAction(ArrowAction):
         cr.stroke()
 
 class RectAction(DrawingAction):
+    __slots__ = ('start', 'end', 'color', 'width', 'fill_color')
+
     def __init__(self, start, end, color, width, fill_color=None):
         self.start = start
         self.end = end
@@ -247,6 +334,8 @@ class RectAction(DrawingAction):
         self.end = (self.end[0] + dx, self.end[1] + dy)
 
 class CircleAction(RectAction):
+    __slots__ = ()
+
     def draw(self, cr, image_to_widget_coords, scale):
         x1, y1 = image_to_widget_coords(*self.start)
         x2, y2 = image_to_widget_coords(*self.end)
@@ -267,29 +356,32 @@ class CircleAction(RectAction):
         cr.stroke()
 
 class HighlighterAction(StrokeAction):
+    __slots__ = ()
+
     def draw(self, cr, image_to_widget_coords, scale):
         if len(self.stroke) < 2:
             return
-        coords = [image_to_widget_coords(x, y) for x, y in self.stroke]
         cr.set_operator(cairo.Operator.MULTIPLY)
         cr.set_source_rgba(*self.color)
         cr.set_line_width(self.pen_size * scale)
         cr.set_line_cap(cairo.LineCap.BUTT)
-        cr.move_to(*coords[0])
-        for point in coords[1:]:
-            cr.line_to(*point)
+        self._append_path(cr, image_to_widget_coords)
         cr.stroke()
         cr.set_operator(cairo.Operator.OVER)
         cr.set_line_cap(cairo.LineCap.ROUND)
 
 class CensorAction(RectAction):
+    __slots__ = ('pixelation_level', 'background_pixbuf', '_randomized_cache')
+
     def __init__(self, start, end, pixelation_level=8, background_pixbuf=None):
         super().__init__(start, end, (0, 0, 0, 0), 0, None)
         self.pixelation_level = pixelation_level
         self.background_pixbuf = background_pixbuf
+        self._randomized_cache = None
 
     def set_background(self, pixbuf):
         self.background_pixbuf = pixbuf
+        self._randomized_cache = None
 
     def draw(self, cr, image_to_widget_coords, scale):
         rect = self._get_widget_rect(image_to_widget_coords)
@@ -300,9 +392,22 @@ class CensorAction(RectAction):
         if not crop:
             return
 
+        randomized = self._get_randomized(crop)
+        if not randomized:
+            return
+
+        self._draw_pixbuf(cr, randomized, rect)
+
+    def _get_randomized(self, crop):
+        # The scramble is seeded, so it only changes with the region; reuse
+        # it across redraws instead of rerunning the per-pixel loop.
+        cache_key = (crop['x'], crop['y'], crop['width'], crop['height'], self.pixelation_level)
+        if self._randomized_cache and self._randomized_cache[0] == cache_key:
+            return self._randomized_cache[1]
+
         cropped = self._crop_pixbuf(crop)
         if not cropped:
-            return
+            return None
 
         # Scale down for pixelation
         pixel_size = self.pixelation_level
@@ -313,16 +418,9 @@ class CensorAction(RectAction):
         )
 
         randomized = self._randomize_pixels(small)
-        if not randomized:
-            return
-
-        pixelated = randomized.scale_simple(
-            int(rect['width']),
-            int(rect['height']),
-            GdkPixbuf.InterpType.NEAREST
-        )
-
-        self._draw_pixbuf(cr, pixelated, rect)
+        if randomized:
+            self._randomized_cache = (cache_key, randomized)
+        return randomized
 
     def _get_widget_rect(self, transform):
         x1, y1 = transform(*self.start)
@@ -371,22 +469,24 @@ class CensorAction(RectAction):
         w, h = pixbuf.get_width(), pixbuf.get_height()
         stride, channels = pixbuf.get_rowstride(), pixbuf.get_n_channels()
         offsets = [(-1,0),(1,0),(0,-1),(0,1),(-1,-1),(1,-1),(-1,1),(1,1)]
-        random.seed(42)
+        # A private generator keeps the scramble stable without
+        # reseeding the module-level one the rest of the app shares.
+        rng = random.Random(42)
+        rand, choice = rng.random, rng.choice
 
         for y in range(h):
             for x in range(w):
-                if random.random() < 0.3:
+                if rand() < 0.3:
                     neighbors = [(x+dx, y+dy) for dx, dy in offsets if 0 <= x+dx < w and 0 <= y+dy < h]
                     if neighbors:
-                        nx, ny = random.choice(neighbors)
+                        nx, ny = choice(neighbors)
                         i1 = y * stride + x * channels
                         i2 = ny * stride + nx * channels
-                        for c in range(channels):
-                            pixels[i1 + c], pixels[i2 + c] = pixels[i2 + c], pixels[i1 + c]
+                        pixels[i1:i1 + channels], pixels[i2:i2 + channels] = pixels[i2:i2 + channels], pixels[i1:i1 + channels]
 
         try:
-            return GdkPixbuf.Pixbuf.new_from_data(
-                bytes(pixels),
+            return GdkPixbuf.Pixbuf.new_from_bytes(
+                GLib.Bytes.new(pixels),
                 GdkPixbuf.Colorspace.RGB,
                 pixbuf.get_has_alpha(),
                 8, w, h, stride
@@ -396,13 +496,21 @@ class CensorAction(RectAction):
             return None
 
     def _draw_pixbuf(self, cr, pixbuf, rect):
+        # Let cairo blow the small pixbuf up with nearest-neighbour sampling
+        # rather than allocating a widget-sized copy on every frame.
         cr.save()
-        Gdk.cairo_set_source_pixbuf(cr, pixbuf, rect['x'], rect['y'])
         cr.rectangle(rect['x'], rect['y'], rect['width'], rect['height'])
-        cr.fill()
+        cr.clip()
+        cr.translate(rect['x'], rect['y'])
+        cr.scale(rect['width'] / pixbuf.get_width(), rect['height'] / pixbuf.get_height())
+        Gdk.cairo_set_source_pixbuf(cr, pixbuf, 0, 0)
+        cr.get_source().set_filter(cairo.Filter.NEAREST)
+        cr.paint()
         cr.restore()
 
 class NumberStampAction(DrawingAction):
+    __slots__ = ('position', 'number', 'radius', 'fill_color', 'creation_time', 'text_color')
+
     def __init__(self, position, number, radius, fill_color, text_color=None):
         super().__init__()
         self.position = position
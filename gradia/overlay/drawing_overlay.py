@@ -69,11 +69,19 @@ class DrawingOverlay(Gtk.DrawingArea):
         self.live_text = None
         self.editing_text_action = None
 
+        self._paintable_size = None
+        self._image_bounds_cache = None
+
         self._setup_gestures()
 
     def set_picture_reference(self, picture):
         self.picture_widget = picture
-        picture.connect("notify::paintable", lambda *args: self.queue_draw())
+        picture.connect("notify::paintable", self._on_paintable_changed)
+
+    def _on_paintable_changed(self, *args):
+        self._paintable_size = None
+        self._image_bounds_cache = None
+        self.queue_draw()
 
     def set_controls_overlay(self, controls_overlay):
         self.controls_overlay = controls_overlay
@@ -87,30 +95,47 @@ class DrawingOverlay(Gtk.DrawingArea):
         self._selected_action = action
         self.controls_overlay.set_delete_visible(action is not None)
 
+    def _get_paintable_size(self):
+        """Intrinsic size of the displayed paintable, cached until the paintable changes"""
+        if self._paintable_size is None:
+            paintable = self.picture_widget.get_paintable() if self.picture_widget else None
+            if paintable:
+                self._paintable_size = (paintable.get_intrinsic_width(), paintable.get_intrinsic_height())
+            else:
+                self._paintable_size = ()
+        return self._paintable_size
+
     def _get_image_bounds(self):
-        if not self.picture_widget or not self.picture_widget.get_paintable():
+        paintable_size = self._get_paintable_size()
+        if not paintable_size:
             return 0, 0, self.get_width(), self.get_height()
         widget_w = self.picture_widget.get_width()
         widget_h = self.picture_widget.get_height()
-        img_w = self.picture_widget.get_paintable().get_intrinsic_width()
-        img_h = self.picture_widget.get_paintable().get_intrinsic_height()
+        cached = self._image_bounds_cache
+        if cached and cached[0] == widget_w and cached[1] == widget_h:
+            return cached[2]
+        img_w, img_h = paintable_size
         if img_w <= 0 or img_h <= 0:
-            return 0, 0, widget_w, widget_h
-        scale = min(widget_w / img_w, widget_h / img_h)
-        disp_w = img_w * scale
-        disp_h = img_h * scale
-        offset_x = (widget_w - disp_w) / 2
-        offset_y = (widget_h - disp_h) / 2
-        return offset_x, offset_y, disp_w, disp_h
+            bounds = (0, 0, widget_w, widget_h)
+        else:
+            scale = min(widget_w / img_w, widget_h / img_h)
+            disp_w = img_w * scale
+            disp_h = img_h * scale
+            offset_x = (widget_w - disp_w) / 2
+            offset_y = (widget_h - disp_h) / 2
+            bounds = (offset_x, offset_y, disp_w, disp_h)
+        self._image_bounds_cache = (widget_w, widget_h, bounds)
+        return bounds
 
     def _get_modified_image_bounds(self):
-        return self.picture_widget.get_paintable().get_intrinsic_width(), self.picture_widget.get_paintable().get_intrinsic_height()
+        return self._get_paintable_size()
 
     def _get_scale_factor(self):
         _, _, dw, dh = self._get_image_bounds()
-        if not self.picture_widget or not self.picture_widget.get_paintable():
+        paintable_size = self._get_paintable_size()
+        if not paintable_size:
             return 1.0
-        img_w = self.picture_widget.get_paintable().get_intrinsic_width()
+        img_w = paintable_size[0]
         return dw / img_w if img_w else 1.0
 
     def _widget_to_image_coords(self, x, y):
@@ -518,10 +543,10 @@ class DrawingOverlay(Gtk.DrawingArea):
         if self.is_drawing and self.drawing_mode != DrawingMode.TEXT and self.drawing_mode != DrawingMode.NUMBER:
             cr.set_source_rgba(*self.pen_color)
             if self.drawing_mode == DrawingMode.PEN and len(self.current_stroke) > 1:
-                StrokeAction(self.current_stroke, self.pen_color, self.pen_size).draw(cr, self._image_to_widget_coords, scale)
+                StrokeAction(self.current_stroke, self.pen_color, self.pen_size, cache_path=False).draw(cr, self._image_to_widget_coords, scale)
             elif self.drawing_mode == DrawingMode.HIGHLIGHTER and len(self.current_stroke) > 1:
                 highlighter_color = (self.pen_color[0], self.pen_color[1], self.pen_color[2], 0.3)
-                HighlighterAction(self.current_stroke, highlighter_color, self.highlighter_size).draw(cr, self._image_to_widget_coords, scale)
+                HighlighterAction(self.current_stroke, highlighter_color, self.highlighter_size, cache_path=False).draw(cr, self._image_to_widget_coords, scale)
             elif self.start_point and self.end_point:
                 if self.drawing_mode == DrawingMode.ARROW:
                     ArrowAction(self.start_point, self.end_point, self.pen_color, self.arrow_head_size, self.pen_size).draw(cr, self._image_to_widget_coords, scale)
@@ -18,7 +18,7 @@
 import os
 
 from gi.repository import Gtk, Gio, GdkPixbuf
-from gradia.clipboard import copy_file_to_clipboard, save_pixbuff_to_path
+from gradia.clipboard import copy_pixbuf_to_clipboard
 
 ExportFormat = tuple[str, str, str]
 
@@ -32,9 +32,8 @@ class BaseImageExporter:
         (".webp", "image/webp", "WebP Image"),
     ]
 
-    def __init__(self, window: Gtk.ApplicationWindow, temp_dir: str) -> None:
+    def __init__(self, window: Gtk.ApplicationWindow) -> None:
         self.window: Gtk.ApplicationWindow = window
-        self.temp_dir: str = temp_dir
 
     def get_processed_pixbuf(self):
         return self.overlay_pixbuffs(self.window.processed_pixbuf, self.window.drawing_overlay.export_to_pixbuf())
@@ -83,8 +82,8 @@ class BaseImageExporter:
 class FileDialogExporter(BaseImageExporter):
     """Handles exporting images through file dialog"""
 
-    def __init__(self, window: Gtk.ApplicationWindow, temp_dir: str) -> None:
-        super().__init__(window, temp_dir)
+    def __init__(self, window: Gtk.ApplicationWindow) -> None:
+        super().__init__(window)
 
     def save_to_file(self) -> None:
         """Open save dialog to export processed image"""
@@ -161,19 +160,15 @@ class ClipboardExporter(BaseImageExporter):
 
     TEMP_CLIPBOARD_EXPORT_FILENAME: str = "clipboard_export.png"
 
-    def __init__(self, window: Gtk.ApplicationWindow, temp_dir: str) -> None:
-        super().__init__(window, temp_dir)
+    def __init__(self, window: Gtk.ApplicationWindow) -> None:
+        super().__init__(window)
 
     def copy_to_clipboard(self) -> None:
         """Copy processed image to system clipboard"""
         try:
             self._ensure_processed_image_available()
 
-            temp_path = save_pixbuff_to_path(self.temp_dir, self.get_processed_pixbuf())
-            if not temp_path or not os.path.exists(temp_path):
-                raise Exception("Failed to create temporary file for clipboard")
-
-            copy_file_to_clipboard(temp_path)
+            copy_pixbuf_to_clipboard(self.get_processed_pixbuf())
             self.window._show_notification(_("Image copied to clipboard"))
 
         except Exception as e:
@@ -184,12 +179,11 @@ class ClipboardExporter(BaseImageExporter):
 class ExportManager:
     """Coordinates export functionality"""
 
-    def __init__(self, window: Gtk.ApplicationWindow, temp_dir: str) -> None:
+    def __init__(self, window: Gtk.ApplicationWindow) -> None:
         self.window: Gtk.ApplicationWindow = window
-        self.temp_dir: str = temp_dir
 
-        self.file_exporter: FileDialogExporter = FileDialogExporter(window, temp_dir)
-        self.clipboard_exporter: ClipboardExporter = ClipboardExporter(window, temp_dir)
+        self.file_exporter: FileDialogExporter = FileDialogExporter(window)
+        self.clipboard_exporter: ClipboardExporter = ClipboardExporter(window)
 
     def save_to_file(self) -> None:
         """Export to file using file dialog"""
@@ -33,9 +33,8 @@ class BaseImageLoader:
         (".avif", "image/avif"),
     ]
 
-    def __init__(self, window: Gtk.ApplicationWindow, temp_dir: str) -> None:
+    def __init__(self, window: Gtk.ApplicationWindow) -> None:
         self.window: Gtk.ApplicationWindow = window
-        self.temp_dir: str = temp_dir
 
     def _is_supported_format(self, file_path: str) -> bool:
         """Check if file format is supported"""
@@ -54,8 +53,8 @@ class BaseImageLoader:
 
 class FileDialogImageLoader(BaseImageLoader):
     """Handles loading images through file dialog"""
-    def __init__(self, window: Gtk.ApplicationWindow, temp_dir: str) -> None:
-        super().__init__(window, temp_dir)
+    def __init__(self, window: Gtk.ApplicationWindow) -> None:
+        super().__init__(window)
 
     def open_file_dialog(self) -> None:
         """Open file dialog to select an image"""
@@ -98,8 +97,8 @@ class FileDialogImageLoader(BaseImageLoader):
 
 
 class DragDropImageLoader(BaseImageLoader):
-    def __init__(self, window: Gtk.ApplicationWindow, temp_dir: str) -> None:
-        super().__init__(window, temp_dir)
+    def __init__(self, window: Gtk.ApplicationWindow) -> None:
+        super().__init__(window)
 
     def handle_file_drop(
         self,
@@ -129,8 +128,8 @@ class DragDropImageLoader(BaseImageLoader):
 class ClipboardImageLoader(BaseImageLoader):
     TEMP_CLIPBOARD_FILENAME: str = "clipboard_image.png"
 
-    def __init__(self, window: Gtk.ApplicationWindow, temp_dir: str) -> None:
-        super().__init__(window, temp_dir)
+    def __init__(self, window: Gtk.ApplicationWindow) -> None:
+        super().__init__(window)
 
     def load_from_clipboard(self) -> None:
         clipboard = self.window.get_clipboard()
@@ -149,7 +148,7 @@ class ClipboardImageLoader(BaseImageLoader):
                 self.window._show_notification(_("No image found in clipboard"))
                 return
 
-            image_path = save_texture_to_file(texture, self.temp_dir)
+            image_path = save_texture_to_file(texture, self.window.get_temp_dir())
             if not image_path:
                 raise Exception("Failed to save clipboard image to file")
 
@@ -172,8 +171,8 @@ class ClipboardImageLoader(BaseImageLoader):
 class ScreenshotImageLoader(BaseImageLoader):
     """Handles loading images through screenshot capture"""
 
-    def __init__(self, window: Gtk.ApplicationWindow, temp_dir: str, app: Gtk.Application) -> None:
-        super().__init__(window, temp_dir)
+    def __init__(self, window: Gtk.ApplicationWindow, app: Gtk.Application) -> None:
+        super().__init__(window)
         self.portal = Xdp.Portal()
         self._error_callback: Optional[Callable[[str], None]] = None
         self._success_callback: Optional[Callable[[], None]] = None
@@ -245,7 +244,7 @@ class ScreenshotImageLoader(BaseImageLoader):
                 raise Exception("Failed to load screenshot data")
 
             temp_filename = f"screenshot_{os.urandom(6).hex()}.png"
-            temp_path = os.path.join(self.temp_dir, temp_filename)
+            temp_path = os.path.join(self.window.get_temp_dir(), temp_filename)
 
             with open(temp_path, 'wb') as f:
                 f.write(contents)
@@ -284,8 +283,8 @@ class ScreenshotImageLoader(BaseImageLoader):
 
 class CommandlineLoader(BaseImageLoader):
     """Handles loading images from command line arguments or programmatic file paths"""
-    def __init__(self, window: Gtk.ApplicationWindow, temp_dir: str) -> None:
-        super().__init__(window, temp_dir)
+    def __init__(self, window: Gtk.ApplicationWindow) -> None:
+        super().__init__(window)
 
     def load_from_file(self, file_path: str) -> None:
         try:
@@ -310,15 +309,14 @@ class CommandlineLoader(BaseImageLoader):
             print(f"Error loading file from command line: {e}")
 
 class ImportManager:
-    def __init__(self, window: Gtk.ApplicationWindow, temp_dir: str, app: Gtk.Application) -> None:
+    def __init__(self, window: Gtk.ApplicationWindow, app: Gtk.Application) -> None:
         self.window: Gtk.ApplicationWindow = window
-        self.temp_dir: str = temp_dir
 
-        self.file_loader: FileDialogImageLoader = FileDialogImageLoader(window, temp_dir)
-        self.drag_drop_loader: DragDropImageLoader = DragDropImageLoader(window, temp_dir)
-        self.clipboard_loader: ClipboardImageLoader = ClipboardImageLoader(window, temp_dir)
-        self.screenshot_loader: ScreenshotImageLoader = ScreenshotImageLoader(window, temp_dir, app)
-        self.commandline_loader: CommandlineLoader = CommandlineLoader(window, temp_dir)
+        self.file_loader: FileDialogImageLoader = FileDialogImageLoader(window)
+        self.drag_drop_loader: DragDropImageLoader = DragDropImageLoader(window)
+        self.clipboard_loader: ClipboardImageLoader = ClipboardImageLoader(window)
+        self.screenshot_loader: ScreenshotImageLoader = ScreenshotImageLoader(window, app)
+        self.commandline_loader: CommandlineLoader = CommandlineLoader(window)
 
     def open_file_dialog(self) -> None:
         self.file_loader.open_file_dialog()
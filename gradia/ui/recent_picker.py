@@ -101,6 +101,9 @@ class RecentPicker(Gtk.Box):
     MAX_FILENAME_LENGTH = 30
     FILENAME_TRUNCATE_LENGTH = 27
 
+    # Shared by every window's picker, keyed by (path, mtime)
+    _thumbnail_cache: dict[tuple[str, float], Gdk.Texture] = {}
+
     def __init__(self, callback=None):
         super().__init__(orientation=Gtk.Orientation.VERTICAL)
         self.image_getter = RecentImageGetter()
@@ -217,31 +220,32 @@ class RecentPicker(Gtk.Box):
         thread = threading.Thread(target=load_in_thread, daemon=True)
         thread.start()
 
+    def _load_thumbnail(self, path):
+        cache_key = (str(path), path.stat().st_mtime)
+        texture = self._thumbnail_cache.get(cache_key)
+        if texture is None:
+            # Let the loader scale while decoding instead of
+            # decoding the full screenshot and shrinking it after.
+            scaled_pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(
+                str(path), self.IMAGE_WIDTH, self.IMAGE_HEIGHT, True
+            )
+            texture = Gdk.Texture.new_for_pixbuf(scaled_pixbuf)
+            self._thumbnail_cache[cache_key] = texture
+        return cache_key, texture
+
     def _update_display(self, recent_files):
         self.recent_files = recent_files
+        shown_keys = set()
 
         for i in range(self.GRID_ROWS * self.GRID_COLS):
             if i < len(recent_files):
                 file_obj = recent_files[i]
 
                 try:
-                    pixbuf = GdkPixbuf.Pixbuf.new_from_file(str(file_obj.path))
-
-                    width = pixbuf.get_width()
-                    height = pixbuf.get_height()
-
-                    scale_x = self.IMAGE_WIDTH / width
-                    scale_y = self.IMAGE_HEIGHT / height
-                    scale = min(scale_x, scale_y)
+                    cache_key, texture = self._load_thumbnail(file_obj.path)
+                    shown_keys.add(cache_key)
 
-                    new_width = int(width * scale)
-                    new_height = int(height * scale)
-
-                    scaled_pixbuf = pixbuf.scale_simple(
-                        new_width, new_height, GdkPixbuf.InterpType.BILINEAR
-                    )
-
-                    image = Gtk.Image.new_from_pixbuf(scaled_pixbuf)
+                    image = Gtk.Image.new_from_paintable(texture)
                     self.image_buttons[i].set_child(image)
                     self._fade_in_widget(image)
 
@@ -263,6 +267,10 @@ class RecentPicker(Gtk.Box):
                 self.image_buttons[i].set_sensitive(False)
                 self.name_labels[i].set_text("")
 
+        # Forget screenshots that dropped out of the recent list
+        for cache_key in self._thumbnail_cache.keys() - shown_keys:
+            del self._thumbnail_cache[cache_key]
+
     def on_image_click(self, index):
         if index < len(self.recent_files):
             file_path = self.recent_files[index].path
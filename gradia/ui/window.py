@@ -15,7 +15,6 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-import os
 import threading
 from collections.abc import Callable
 from typing import Optional, Any
@@ -32,6 +31,13 @@ from gradia.ui.misc import *
 from gradia.ui.image_loaders import ImportManager
 from gradia.ui.image_exporters import ExportManager
 from gradia.overlay.drawing_actions import DrawingMode
+from gradia.overlay.drawing_overlay import DEFAULT_PEN_COLOR
+from gradia.backend.logger import Logger
+
+logging = Logger()
+
+RGBAColor = tuple[float, float, float, float]
+FALLBACK_FILL_COLOR: RGBAColor = (0.0, 0.0, 0.0, 0.0)
 
 
 class GradientWindow(Adw.ApplicationWindow):
@@ -45,20 +51,20 @@ class GradientWindow(Adw.ApplicationWindow):
     PAGE_IMAGE: str = "image"
     PAGE_LOADING: str = "loading"
 
-    TEMP_PROCESSED_FILENAME: str = "processed.png"
+    PROCESS_DEBOUNCE_MS: int = 50
 
-    def __init__(self, temp_dir: str, version: str, init_screenshot_mode: Xdp.ScreenshotFlags , file_path: str = None, **kwargs) -> None:
+    def __init__(self, temp_dir_name: str, version: str, init_screenshot_mode: Xdp.ScreenshotFlags , file_path: str = None, **kwargs) -> None:
         super().__init__(**kwargs)
 
         self.app: Adw.Application = kwargs['application']
-        self.temp_dir: str = temp_dir
+        self.temp_dir_name: str = temp_dir_name
         self.version: str = version
         self.image_path: Optional[str] = None
-        self.processed_path: Optional[str] = None
         self.processed_pixbuf: Optional[Gdk.Pixbuf] = None
+        self._process_source_id: Optional[int] = None
 
-        self.export_manager: ExportManager = ExportManager(self, temp_dir)
-        self.import_manager: ImportManager = ImportManager(self, temp_dir, self.app)
+        self.export_manager: ExportManager = ExportManager(self)
+        self.import_manager: ImportManager = ImportManager(self, self.app)
 
         self.background_selector: BackgroundSelector = BackgroundSelector(
             gradient=GradientBackground(),
@@ -70,9 +76,7 @@ class GradientWindow(Adw.ApplicationWindow):
 
         self.processor: ImageProcessor = ImageProcessor(padding=5, background=self.background_selector.get_current_background())
 
-        self.create_action("shortcuts", self._on_shortcuts_activated)
         self.create_action("about", self._on_about_activated)
-        self.create_action('quit', lambda *_: self.app.quit(), ['<primary>q'])
         self.create_action("shortcuts", self._on_shortcuts_activated,  ['<primary>question'])
 
         self.create_action("open", lambda *_: self.import_manager.open_file_dialog(), ["<Primary>o"])
@@ -90,8 +94,8 @@ class GradientWindow(Adw.ApplicationWindow):
             vt="(si)"
         )
 
-        self.create_action("save", lambda *_: self.export_manager.save_to_file(), ["<Primary>s"], enabled=False)
-        self.create_action("copy", lambda *_: self.export_manager.copy_to_clipboard(), ["<Primary>c"], enabled=False)
+        self.create_action("save", self._on_save_activated, ["<Primary>s"], enabled=False)
+        self.create_action("copy", self._on_copy_activated, ["<Primary>c"], enabled=False)
 
         self.create_action("quit", lambda *_: self.close(), ["<Primary>q"])
 
@@ -110,6 +114,8 @@ class GradientWindow(Adw.ApplicationWindow):
 
         self.file_path = file_path
 
+        self.connect("close-request", self._on_close_request)
+
         if init_screenshot_mode is not None:
             def screenshot_error_callback(error_message: str) -> None:
                  self.app.quit()
@@ -119,6 +125,9 @@ class GradientWindow(Adw.ApplicationWindow):
 
             self.import_manager.take_screenshot(init_screenshot_mode, screenshot_error_callback, screenshot_success_callback)
 
+    def get_temp_dir(self) -> str:
+        return self.app.get_temp_dir(self.temp_dir_name)
+
     def create_action(self, name: str, callback: Callable[..., None], shortcuts: Optional[list[str]] = None, enabled: bool = True, vt: str = None) -> None:
         variant_type = GLib.VariantType.new(vt) if vt is not None else None
         action: Gio.SimpleAction = Gio.SimpleAction.new(name, variant_type)
@@ -254,24 +263,62 @@ class GradientWindow(Adw.ApplicationWindow):
             self._trigger_processing()
 
         except Exception as e:
-            print(f"Invalid aspect ratio: {text} ({e})")
+            logging.debug("Invalid aspect ratio: %s (%s)", text, e)
 
     def on_shadow_strength_changed(self, strength) -> None:
         self.processor.shadow_strength = strength.get_value()
         self._trigger_processing()
 
-    def _parse_rgba(self, color_string):
-        return map(float, color_string.split(','))
+    def _parse_rgba(self, color_string: str, fallback: RGBAColor) -> RGBAColor:
+        r_end = color_string.find(',')
+        g_end = color_string.find(',', r_end + 1)
+        b_end = color_string.find(',', g_end + 1)
+        if b_end == -1:
+            return fallback
+        try:
+            return (
+                float(color_string[:r_end]),
+                float(color_string[r_end + 1:g_end]),
+                float(color_string[g_end + 1:b_end]),
+                float(color_string[b_end + 1:])
+            )
+        except ValueError:
+            return fallback
 
     def _set_pen_color_from_string(self, color_string):
-        self.drawing_overlay.set_pen_color(*self._parse_rgba(color_string))
+        self.drawing_overlay.set_pen_color(*self._parse_rgba(color_string, DEFAULT_PEN_COLOR))
 
     def _set_fill_color_from_string(self, color_string):
-        self.drawing_overlay.set_fill_color(*self._parse_rgba(color_string))
+        self.drawing_overlay.set_fill_color(*self._parse_rgba(color_string, FALLBACK_FILL_COLOR))
 
     def _trigger_processing(self) -> None:
-        if self.image_path:
-            self.process_image()
+        # Spin rows and colour pickers fire on every step, so collapse a
+        # burst of changes into a single processing run.
+        if self.image_path and self._process_source_id is None:
+            self._process_source_id = GLib.timeout_add(self.PROCESS_DEBOUNCE_MS, self._on_process_timeout)
+
+    def _on_process_timeout(self) -> bool:
+        self._process_source_id = None
+        self.process_image()
+        return False
+
+    def _cancel_pending_processing(self) -> bool:
+        if self._process_source_id is None:
+            return False
+        GLib.source_remove(self._process_source_id)
+        self._process_source_id = None
+        return True
+
+    def _flush_processing(self) -> None:
+        # Exports read processed_pixbuf directly, so a change still waiting
+        # in the debounce window has to be rendered before they run. This
+        # runs process() synchronously on the UI thread.
+        if self._cancel_pending_processing():
+            self._process_in_background()
+
+    def _on_close_request(self, *args) -> bool:
+        self._cancel_pending_processing()
+        return False
 
     def process_image(self) -> None:
         if not self.image_path:
@@ -285,8 +332,6 @@ class GradientWindow(Adw.ApplicationWindow):
                 self.processor.set_image_path(self.image_path)
                 pixbuf: Gdk.Pixbuf = self.processor.process()
                 self.processed_pixbuf = pixbuf
-                self.processed_path = os.path.join(self.temp_dir, self.TEMP_PROCESSED_FILENAME)
-                pixbuf.savev(self.processed_path, "png", [], [])
             else:
                 print("No image path set for processing.")
 
@@ -327,6 +372,14 @@ class GradientWindow(Adw.ApplicationWindow):
             child: str = getattr(self, "_previous_stack_child", self.PAGE_IMAGE)
             self.image_stack.set_visible_child_name(child)
 
+    def _on_save_activated(self, action: Gio.SimpleAction, param) -> None:
+        self._flush_processing()
+        self.export_manager.save_to_file()
+
+    def _on_copy_activated(self, action: Gio.SimpleAction, param) -> None:
+        self._flush_processing()
+        self.export_manager.copy_to_clipboard()
+
     def _on_about_activated(self, action: Gio.SimpleAction, param) -> None:
         about = create_about_dialog(version=self.version)
         about.present(self)